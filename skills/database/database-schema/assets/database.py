@@ -5,83 +5,167 @@ This module provides database configuration for PostgreSQL, MongoDB, and SQLite
 with proper connection management and session handling.
 """
 
+import atexit
 import os
-from collections.abc import Generator
+import threading
+from collections.abc import AsyncGenerator
+from functools import lru_cache
 
-from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 # Database URL from environment variables
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
 
+# asyncio driver used for each backend, whatever driver the URL names
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+# Seconds to wait for a pooled connection before failing instead of hanging
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "2.0"))
+
+
+def _async_url(url: str) -> str:
+    """
+    Select the asyncio driver (asyncpg/aiosqlite) for a database URL, replacing
+    any sync driver it names (e.g. postgresql+psycopg2, sqlite+pysqlite)
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        return url
+    parsed = parsed.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+    return parsed.render_as_string(hide_password=False)
+
+
+def _create_sqlite_engine(url: str):
+    """
+    Create a SQLite engine; in-memory databases need one shared connection
+    """
+    if ":memory:" in url or url in ("sqlite://", "sqlite:///"):
+        return create_async_engine(
+            _async_url(url),
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            echo=False,
+        )
+    return create_async_engine(
+        _async_url(url),
+        connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=POOL_TIMEOUT,
+        echo=False,
+    )
+
+
 # Create engine based on database type
 if DATABASE_URL.startswith("postgresql"):
     # PostgreSQL configuration
-    engine = create_engine(
-        DATABASE_URL,
-        pool_size=20,
-        max_overflow=30,
+    engine = create_async_engine(
+        _async_url(DATABASE_URL),
+        pool_size=int(os.getenv("SQLALCHEMY_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "30")),
         pool_pre_ping=True,
-        pool_recycle=3600,
+        pool_recycle=int(os.getenv("SQLALCHEMY_POOL_RECYCLE", "3600")),
+        pool_timeout=POOL_TIMEOUT,
         echo=False,
     )
 elif DATABASE_URL.startswith("sqlite"):
     # SQLite configuration
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=False,
-    )
+    engine = _create_sqlite_engine(DATABASE_URL)
 else:
     # Default to SQLite
-    from sqlalchemy.pool import StaticPool
-
-    engine = create_engine(
-        "sqlite:///./app.db",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=False,
-    )
+    engine = _create_sqlite_engine("sqlite:///./app.db")
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 Base = declarative_base()
 
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession]:
     """
     Dependency to get database session
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def warm_pool() -> None:
+    """
+    Open pool_size connections up front so the first requests skip connect
+    """
+    size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+    connections = [await engine.connect() for _ in range(size)]
+    for connection in connections:
+        await connection.close()
 
 
 # For MongoDB integration
-def get_mongo_client():
+_mongo_clients: list = []
+
+
+@lru_cache(maxsize=16)
+def _cached_mongo_client(mongo_url: str):
     """
-    Get MongoDB client connection
+    Build one native asyncio client (and connection pool) per URL
     """
-    from pymongo import MongoClient
+    from pymongo import AsyncMongoClient
+
+    client = AsyncMongoClient(
+        mongo_url, maxPoolSize=int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    )
+    _mongo_clients.append(client)
+    return client
 
+
+def get_mongo_client():
+    """
+    Get async MongoDB client connection (shared across requests)
+    """
     mongo_url = os.getenv("MONGO_URL", "mongodb://localhost:27017/")
-    return MongoClient(mongo_url)
+    return _cached_mongo_client(mongo_url)
+
+
+async def close_mongo_clients() -> None:
+    """
+    Close cached async MongoDB clients; call from the app shutdown hook
+    """
+    while _mongo_clients:
+        await _mongo_clients.pop().close()
+    _cached_mongo_client.cache_clear()
 
 
 # For ODMantic integration
+_odmantic_engines: dict[tuple[str, str], object] = {}
+_odmantic_engines_lock = threading.Lock()
+
+
 def get_odmantic_engine():
     """
-    Get ODMantic engine for MongoDB
+    Get ODMantic engine for MongoDB (shared across requests)
     """
-    from motor.motor_asyncio import AsyncIOMotorClient
-    from odmantic import AIOEngine
-
     mongo_url = os.getenv("MONGO_URL", "mongodb://localhost:27017/")
-    client = AsyncIOMotorClient(mongo_url)
     database_name = os.getenv("MONGO_DATABASE", "fastapi_app")
-
-    return AIOEngine(client=client, database=database_name)
+    key = (mongo_url, database_name)
+
+    with _odmantic_engines_lock:
+        odm_engine = _odmantic_engines.get(key)
+        if odm_engine is None:
+            from motor.motor_asyncio import AsyncIOMotorClient
+            from odmantic import AIOEngine
+
+            client = AsyncIOMotorClient(
+                mongo_url,
+                maxPoolSize=int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+                minPoolSize=int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+            )
+            atexit.register(client.close)
+            odm_engine = AIOEngine(client=client, database=database_name)
+            _odmantic_engines[key] = odm_engine
+
+    return odm_engine
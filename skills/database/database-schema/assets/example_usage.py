@@ -6,48 +6,131 @@ with FastAPI applications for PostgreSQL, MongoDB, and SQLite.
 """
 
 import os
+import time
 
 # Import generated models and database configuration
-from database import Base, get_db
-from fastapi import Depends, FastAPI, HTTPException
+from database import Base, SessionLocal, get_db
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
 from models.user import User  # Example generated model
 from schemas.user import UserCreate, UserResponse  # Example generated schemas
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 app = FastAPI(title="Database Schema Example API")
 
+# COUNT(*) results reused for this many seconds, keyed by filter arguments
+USER_COUNT_TTL = 5.0
+_user_counts: dict[tuple, tuple[float, int]] = {}
+
+
+def users_key_builder(
+    func,
+    namespace: str = "",
+    *,
+    request: Request | None = None,
+    response: Response | None = None,
+    args: tuple = (),
+    kwargs: dict | None = None,
+) -> str:
+    """
+    Cache key from path and query only; the injected session differs per request
+
+    namespace already arrives as "<prefix>:<namespace>", so keys stay under the
+    prefix that FastAPICache.clear(namespace=...) matches.
+    """
+    query = sorted(request.query_params.items()) if request else []
+    path = request.url.path if request else ""
+    return f"{namespace}:{func.__name__}:{path}:{query}"
+
+
+async def user_total_count(
+    response: Response, db: AsyncSession = Depends(get_db)
+) -> None:
+    """
+    Set X-Total-Count from a briefly cached COUNT(*) rather than per request
+    """
+    key = ()  # no filters yet; include them here once get_users accepts any
+    now = time.monotonic()
+    cached = _user_counts.get(key)
+    if cached is None or now - cached[0] > USER_COUNT_TTL:
+        total = await db.scalar(select(func.count()).select_from(User))
+        cached = _user_counts[key] = (now, total)
+    response.headers["X-Total-Count"] = str(cached[1])
+
 
 # Example endpoint using generated models
 @app.post("/users/", response_model=UserResponse)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new user
     """
     db_user = User(**user.dict())
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    # Invalidate cached list/detail responses and counts
+    await FastAPICache.clear(namespace="users")
+    _user_counts.clear()
     return db_user
 
 
-@app.get("/users/", response_model=list[UserResponse])
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@app.get(
+    "/users/",
+    response_model=list[UserResponse],
+    dependencies=[Depends(user_total_count)],
+)
+@cache(expire=30, namespace="users", key_builder=users_key_builder)
+async def get_users(
+    skip: int = Query(0, ge=0, le=100_000),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Get all users with pagination
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    result = await db.execute(select(User).offset(skip).limit(limit))
+    users = result.scalars().all()
+    return [UserResponse.model_validate(user) for user in users]
+
+
+# Declared before /users/{user_id} so "export" is not parsed as an ID
+@app.get("/users/export")
+async def export_users(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10_000, ge=1, le=1_000_000),
+):
+    """
+    Stream users as newline-delimited JSON, fetching rows in batches
+    """
+
+    async def rows():
+        # Own session: it must outlive the dependency teardown while streaming
+        async with SessionLocal() as db:
+            users = await db.stream_scalars(
+                select(User).offset(skip).limit(limit).execution_options(yield_per=100)
+            )
+            async for user in users:
+                yield (
+                    UserResponse.model_validate(user).model_dump_json().encode() + b"\n"
+                )
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @app.get("/users/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+@cache(expire=30, namespace="users", key_builder=users_key_builder)
+async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
     """
     Get a specific user by ID
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return UserResponse.model_validate(user)
 
 
 # Example for MongoDB with ODMantic
@@ -80,13 +163,29 @@ def health_check():
 @app.on_event("startup")
 async def startup_event() -> None:
     """
-    Create database tables on startup
+    Create database tables, warm the connection pool and set up caching
     """
-    from database import engine
+    from database import engine, warm_pool
+
+    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
 
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
     print("Database tables created")
 
+    await warm_pool()
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """
+    Release pooled database connections on shutdown
+    """
+    from database import close_mongo_clients, engine
+
+    await close_mongo_clients()
+    await engine.dispose()
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,77 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#   "aiosqlite",
+#   "fastapi",
+#   "fastapi-cache2",
+#   "httpx",
+#   "jinja2",
+#   "sqlalchemy[asyncio]",
+# ]
+# ///
+
+import os
+import sys
+import types
+import unittest
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Column, Integer, String
+
+# In-memory database, configured before database.py builds its engine
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+from database import Base
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+class UserCreate(BaseModel):
+    name: str
+
+
+class UserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+# Stand-ins for the generated modules example_usage.py imports
+for name, attrs in {
+    "models": {},
+    "models.user": {"User": User},
+    "schemas": {},
+    "schemas.user": {"UserCreate": UserCreate, "UserResponse": UserResponse},
+}.items():
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+
+from fastapi.testclient import TestClient
+
+from example_usage import app
+
+
+# Not run automatically in CI; run from this directory for manual checking.
+class TestUserCacheInvalidation(unittest.TestCase):
+    def test_create_clears_cached_user_list(self):
+        """A list read after a create must include the new row, not a cached page"""
+        with TestClient(app) as client:
+            client.post("/users/", json={"name": "alice"})
+            first = client.get("/users/")
+            self.assertEqual([user["name"] for user in first.json()], ["alice"])
+
+            client.post("/users/", json={"name": "bob"})
+            second = client.get("/users/")
+            self.assertEqual([user["name"] for user in second.json()], ["alice", "bob"])
+            self.assertEqual(second.headers["X-Total-Count"], "2")
+
+
+if __name__ == "__main__":
+    unittest.main()
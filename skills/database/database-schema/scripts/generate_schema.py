@@ -8,417 +8,504 @@ seamlessly with FastAPI applications.
 """
 
 import argparse
-import json
 import os
+import string
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; json.loads accepts bytes as well
+    import json as orjson
 
-def create_project_structure(base_path):
-    """Create the standard project directory structure."""
-    dirs = ["models", "schemas", "database", "migrations", "api", "core"]
-
-    for directory in dirs:
-        path = Path(base_path) / directory
-        path.mkdir(exist_ok=True)
-        # Create __init__.py in each directory
-        (path / "__init__.py").touch(exist_ok=True)
 
-    print(f"Created project structure in {base_path}")
-
-
-def generate_sqlalchemy_models(entities, db_type, base_path):
-    """Generate SQLAlchemy models for SQL databases."""
-    base_content = """from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+# Static file headers, built once per run rather than once per entity
+SQLA_BASE = """from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 """
 
-    base_file = Path(base_path) / "database" / "base.py"
-    with open(base_file, "w") as f:
-        f.write(base_content)
-
-    for entity_name, entity_config in entities.items():
-        model_content = f"""from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+SQLA_MODEL_HEADER = """from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database.base import Base
 """
 
-        # Add database-specific imports
-        if db_type == "postgresql":
-            model_content += """from sqlalchemy.dialects.postgresql import JSONB, UUID, ARRAY
+SQLA_DIALECT_IMPORTS = {
+    "postgresql": """from sqlalchemy.dialects.postgresql import JSONB, UUID, ARRAY
 import uuid
-"""
-        elif db_type == "sqlite":
-            model_content += """from sqlalchemy.dialects.sqlite import JSON
+""",
+    "sqlite": """from sqlalchemy.dialects.sqlite import JSON
+""",
+}
+
+ODMANTIC_BASE = """from odmantic import Model, Field, EmbeddedModel
+from datetime import datetime
+from typing import List, Optional
 """
 
-        model_content += f'''
+MIGRATION_DIALECT_IMPORTS = {
+    "postgresql": """from sqlalchemy.dialects import postgresql
+""",
+    "sqlite": """from sqlalchemy.dialects import sqlite
+""",
+}
 
-class {entity_name}(Base):
-    __tablename__ = "{entity_name.lower()}s"
+SQL_DB_TYPES = ("postgresql", "sqlite")
 
-    id = Column(Integer, primary_key=True, index=True)
-'''
+# Below this many entities, process start-up costs more than it saves
+PARALLEL_MIN_ENTITIES = 8
 
-        # Add fields
-        for field_name, field_config in entity_config.get("fields", {}).items():
-            field_type = field_config["type"]
-            nullable = field_config.get("nullable", True)
-            unique = field_config.get("unique", False)
-            index = field_config.get("index", False)
-
-            nullable_str = "" if nullable else ", nullable=False"
-            unique_str = ", unique=True" if unique else ""
-            index_str = ", index=True" if index else ""
-
-            if field_type.lower() == "string":
-                model_content += f"    {field_name} = Column(String, {nullable_str}{unique_str}{index_str})\n"
-            elif field_type.lower() == "text":
-                model_content += f"    {field_name} = Column(Text, {nullable_str}{unique_str}{index_str})\n"
-            elif field_type.lower() == "integer":
-                model_content += f"    {field_name} = Column(Integer, {nullable_str}{unique_str}{index_str})\n"
-            elif field_type.lower() == "boolean":
-                default_val = field_config.get("default", False)
-                model_content += f"    {field_name} = Column(Boolean, default={default_val}{unique_str}{index_str})\n"
-            elif field_type.lower() == "datetime":
-                model_content += f"    {field_name} = Column(DateTime(timezone=True), server_default=func.now()){unique_str}{index_str}\n"
-            elif field_type.lower() == "json" and db_type == "postgresql":
-                model_content += f"    {field_name} = Column(JSONB, default={{}}, {nullable_str}{unique_str}{index_str})\n"
-            elif field_type.lower() == "uuid" and db_type == "postgresql":
-                model_content += f"    {field_name} = Column(UUID(as_uuid=True), default=uuid.uuid4{unique_str}{index_str})\n"
-
-        # Add relationships if specified
-        for rel_name, rel_config in entity_config.get("relationships", {}).items():
-            rel_type = rel_config["type"]
-            target = rel_config["target"]
-
-            if rel_type.lower() == "many-to-one":
-                # Add foreign key
-                model_content += f'    {rel_config.get("foreign_key", target.lower() + "_id")} = Column(Integer, ForeignKey("{target.lower()}s.id"))\n'
-                # Add relationship
-                model_content += f'    {rel_name} = relationship("{target}", back_populates="{entity_name.lower()}s")\n'
-            elif rel_type.lower() == "one-to-many":
-                # Add relationship (back reference in the target entity)
-                model_content += f'    {rel_name} = relationship("{target}", back_populates="{rel_config.get("back_populates", entity_name.lower())}")\n'
-
-        model_content += f"""
+ENDPOINT_HEADER = """from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import List
 
-    def __repr__(self):
-        return f"<{entity_name}(id={{self.id}})>"
 """
 
-        model_file = Path(base_path) / "models" / f"{entity_name.lower()}.py"
-        with open(model_file, "w") as f:
-            f.write(model_content)
 
-        print(f"Created SQLAlchemy model: {model_file}")
+# Router bodies, parsed once; $entity is the model class, $entity_lower its module
+SQL_ENDPOINT_TPL = string.Template("""from models.${entity_lower} import ${entity}
+from schemas.${entity_lower} import ${entity}Create, ${entity}Update, ${entity}Response
+from database.session import get_db
 
 
-def generate_odmantic_models(entities, base_path):
-    """Generate ODMantic models for MongoDB."""
-    base_content = """from odmantic import Model, Field, EmbeddedModel
-from datetime import datetime
-from typing import List, Optional
-"""
+router = APIRouter(prefix="/${entity_lower}s", tags=["${entity_lower}s"])
 
-    base_file = Path(base_path) / "database" / "base.py"
-    with open(base_file, "w") as f:
-        f.write(base_content)
 
-    for entity_name, entity_config in entities.items():
-        model_content = f"""from odmantic import Model, Field, EmbeddedModel
-from datetime import datetime
-from typing import List, Optional
+@router.post("/", response_model=${entity}Response)
+def create_${entity_lower}(${entity_lower}: ${entity}Create, db: Session = Depends(get_db)):
+    db_${entity_lower} = ${entity}(**${entity_lower}.dict())
+    db.add(db_${entity_lower})
+    db.commit()
+    db.refresh(db_${entity_lower})
+    return db_${entity_lower}
 
-"""
 
-        model_content += f"""
-class {entity_name}(Model):
-"""
+@router.get("/", response_model=List[${entity}Response])
+def get_${entity_lower}s(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    ${entity_lower}s = db.query(${entity}).offset(skip).limit(limit).all()
+    return ${entity_lower}s
 
-        # Add fields
-        for field_name, field_config in entity_config.get("fields", {}).items():
-            field_type = field_config["type"]
-            optional = field_config.get("nullable", True)
-
-            if field_type.lower() == "string":
-                if optional:
-                    model_content += f"    {field_name}: Optional[str] = None\n"
-                else:
-                    model_content += f"    {field_name}: str\n"
-            elif field_type.lower() == "text":
-                if optional:
-                    model_content += f"    {field_name}: Optional[str] = None\n"
-                else:
-                    model_content += f"    {field_name}: str\n"
-            elif field_type.lower() == "integer":
-                if optional:
-                    model_content += f"    {field_name}: Optional[int] = None\n"
-                else:
-                    model_content += f"    {field_name}: int\n"
-            elif field_type.lower() == "boolean":
-                default_val = field_config.get("default", False)
-                model_content += f"    {field_name}: bool = {default_val}\n"
-            elif field_type.lower() == "datetime":
-                model_content += f"    {field_name}: datetime = Field(default_factory=datetime.utcnow)\n"
-
-        # Add relationships if specified
-        for rel_name, rel_config in entity_config.get("relationships", {}).items():
-            rel_type = rel_config["type"]
-            target = rel_config["target"]
-
-            if rel_type.lower() == "reference":
-                model_content += f"    {rel_name}_id: str = Field(reference=True)\n"
-
-        model_content += f'''
 
-    class Config:
-        collection = "{entity_name.lower()}s"
-'''
+@router.get("/{${entity_lower}_id}", response_model=${entity}Response)
+def get_${entity_lower}(${entity_lower}_id: int, db: Session = Depends(get_db)):
+    db_${entity_lower} = db.query(${entity}).filter(${entity}.id == ${entity_lower}_id).first()
+    if db_${entity_lower} is None:
+        raise HTTPException(status_code=404, detail="${entity} not found")
+    return db_${entity_lower}
 
-        model_file = Path(base_path) / "models" / f"{entity_name.lower()}.py"
-        with open(model_file, "w") as f:
-            f.write(model_content)
 
-        print(f"Created ODMantic model: {model_file}")
+@router.put("/{${entity_lower}_id}", response_model=${entity}Response)
+def update_${entity_lower}(${entity_lower}_id: int, ${entity_lower}_update: ${entity}Update, db: Session = Depends(get_db)):
+    db_${entity_lower} = db.query(${entity}).filter(${entity}.id == ${entity_lower}_id).first()
+    if db_${entity_lower} is None:
+        raise HTTPException(status_code=404, detail="${entity} not found")
 
+    update_data = ${entity_lower}_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_${entity_lower}, field, value)
 
-def generate_migration_script(entities, db_type, base_path):
-    """Generate a basic migration script."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    revision_id = f"{timestamp}_initial_schema"
+    db.commit()
+    db.refresh(db_${entity_lower})
+    return db_${entity_lower}
 
-    migration_content = f'''"""Initial database schema
 
-Revision ID: {revision_id}
-Revises:
-Create Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]}
+@router.delete("/{${entity_lower}_id}")
+def delete_${entity_lower}(${entity_lower}_id: int, db: Session = Depends(get_db)):
+    db_${entity_lower} = db.query(${entity}).filter(${entity}.id == ${entity_lower}_id).first()
+    if db_${entity_lower} is None:
+        raise HTTPException(status_code=404, detail="${entity} not found")
 
-"""
-from alembic import op
-import sqlalchemy as sa
-'''
+    db.delete(db_${entity_lower})
+    db.commit()
+    return {"message": "${entity} deleted successfully"}
+""")
 
-    if db_type == "postgresql":
-        migration_content += """from sqlalchemy.dialects import postgresql
-"""
-    elif db_type == "sqlite":
-        migration_content += """from sqlalchemy.dialects import sqlite
-"""
+MONGO_ENDPOINT_TPL = string.Template("""from odmantic import AIOEngine
+from typing import List
 
-    migration_content += f'''
+from models.${entity_lower} import ${entity}
+from schemas.${entity_lower} import ${entity}Create, ${entity}Update, ${entity}Response
+from database.engine import get_engine
 
-# revision identifiers
-revision = '{revision_id}'
-down_revision = None
-branch_labels = None
-depends_on = None
 
-def upgrade():
-    """Create all tables for the database schema."""
-'''
+router = APIRouter(prefix="/${entity_lower}s", tags=["${entity_lower}s"])
 
-    # Add table creation for each entity
-    for entity_name, entity_config in entities.items():
-        migration_content += f"""
-    # Create {entity_name} table
-    op.create_table('{entity_name.lower()}s',
-        sa.Column('id', sa.Integer(), nullable=False),
-"""
 
-        for field_name, field_config in entity_config.get("fields", {}).items():
-            field_type = field_config["type"]
-            nullable = field_config.get("nullable", True)
-
-            if field_type.lower() == "string":
-                length = field_config.get("length", 255)
-                migration_content += f"        sa.Column('{field_name}', sa.String({length}), nullable={str(not nullable).lower()}),\n"
-            elif field_type.lower() == "text":
-                migration_content += f"        sa.Column('{field_name}', sa.Text(), nullable={str(not nullable).lower()}),\n"
-            elif field_type.lower() == "integer":
-                migration_content += f"        sa.Column('{field_name}', sa.Integer(), nullable={str(not nullable).lower()}),\n"
-            elif field_type.lower() == "boolean":
-                default_val = field_config.get("default", False)
-                migration_content += f"        sa.Column('{field_name}', sa.Boolean(), nullable={str(not nullable).lower()}, default={default_val}),\n"
-            elif field_type.lower() == "datetime":
-                migration_content += f"        sa.Column('{field_name}', sa.DateTime(), nullable={str(not nullable).lower()}),\n"
-            elif field_type.lower() == "json" and db_type == "postgresql":
-                migration_content += f"        sa.Column('{field_name}', postgresql.JSONB(), nullable={str(not nullable).lower()}),\n"
-
-        # Add foreign keys if relationships exist
-        for rel_name, rel_config in entity_config.get("relationships", {}).items():
-            rel_type = rel_config["type"]
-            if rel_type.lower() == "many-to-one":
-                target = rel_config["target"]
-                foreign_key = rel_config.get("foreign_key", target.lower() + "_id")
-                migration_content += f"        sa.Column('{foreign_key}', sa.Integer(), sa.ForeignKey('{target.lower()}s.id')), \n"
-
-        migration_content += f"        sa.PrimaryKeyConstraint('id')\n"
-
-        # Add unique constraints
-        for field_name, field_config in entity_config.get("fields", {}).items():
-            if field_config.get("unique", False):
-                migration_content += f"        # sa.UniqueConstraint('{field_name}')  # Uncomment if needed\n"
-
-        migration_content += f"    )\n"
-
-        # Add indexes
-        for field_name, field_config in entity_config.get("fields", {}).items():
-            if field_config.get("index", False):
-                migration_content += f"    op.create_index('ix_{entity_name.lower()}s_{field_name}', '{entity_name.lower()}s', ['{field_name}'])\n"
-
-    migration_content += f'''
+@router.post("/", response_model=${entity}Response)
+async def create_${entity_lower}(${entity_lower}: ${entity}Create, engine: AIOEngine = Depends(get_engine)):
+    db_${entity_lower} = ${entity}(**${entity_lower}.dict())
+    return await engine.save(db_${entity_lower})
 
-def downgrade():
-    """Drop all tables for rollback."""
-'''
 
-    # Reverse order for downgrade
-    for entity_name in reversed(list(entities.keys())):
-        migration_content += f"    op.drop_index('ix_{entity_name.lower()}s_') if op.get_bind().dialect.name != 'sqlite' else None\n"
-        migration_content += f"    op.drop_table('{entity_name.lower()}s')\n"
+@router.get("/", response_model=List[${entity}Response])
+async def get_${entity_lower}s(skip: int = 0, limit: int = 100, engine: AIOEngine = Depends(get_engine)):
+    return await engine.find(${entity}, skip=skip, limit=limit)
 
-    migration_file = (
-        Path(base_path)
-        / "migrations"
-        / f"versions"
-        / f"{revision_id}_initial_schema.py"
-    )
-    migration_file.parent.mkdir(exist_ok=True)
 
-    with open(migration_file, "w") as f:
-        f.write(migration_content)
+@router.get("/{${entity_lower}_id}", response_model=${entity}Response)
+async def get_${entity_lower}(${entity_lower}_id: str, engine: AIOEngine = Depends(get_engine)):
+    db_${entity_lower} = await engine.find_one(${entity}, ${entity}.id == ${entity_lower}_id)
+    if db_${entity_lower} is None:
+        raise HTTPException(status_code=404, detail="${entity} not found")
+    return db_${entity_lower}
 
-    print(f"Created migration script: {migration_file}")
 
+@router.put("/{${entity_lower}_id}", response_model=${entity}Response)
+async def update_${entity_lower}(${entity_lower}_id: str, ${entity_lower}_update: ${entity}Update, engine: AIOEngine = Depends(get_engine)):
+    db_${entity_lower} = await engine.find_one(${entity}, ${entity}.id == ${entity_lower}_id)
+    if db_${entity_lower} is None:
+        raise HTTPException(status_code=404, detail="${entity} not found")
 
-def generate_fastapi_endpoints(entities, db_type, base_path):
-    """Generate FastAPI endpoints for the entities."""
-    for entity_name, entity_config in entities.items():
-        endpoint_content = f"""from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+    update_data = ${entity_lower}_update.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_${entity_lower}, field, value)
 
-"""
+    return await engine.save(db_${entity_lower})
 
-        if db_type in ["postgresql", "sqlite"]:
-            endpoint_content += f'''from models.{entity_name.lower()} import {entity_name}
-from schemas.{entity_name.lower()} import {entity_name}Create, {entity_name}Update, {entity_name}Response
-from database.session import get_db
 
+@router.delete("/{${entity_lower}_id}")
+async def delete_${entity_lower}(${entity_lower}_id: str, engine: AIOEngine = Depends(get_engine)):
+    result = await engine.delete(${entity}, ${entity}.id == ${entity_lower}_id)
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="${entity} not found")
+    return {"message": "${entity} deleted successfully"}
+""")
+
+
+def _column_options(field_config, include_nullable=True):
+    """
+    Render the trailing Column() keyword arguments for a field.
+
+    include_nullable=False leaves the nullable option out altogether (boolean,
+    datetime and uuid columns never render it); it does not mean NOT NULL.
+    """
+    options = []
+    if include_nullable and not field_config.get("nullable", True):
+        options.append(", nullable=False")
+    if field_config.get("unique", False):
+        options.append(", unique=True")
+    if field_config.get("index", False):
+        options.append(", index=True")
+    return "".join(options)
+
+
+# SQLAlchemy column renderers keyed by lower-cased field type
+SQLA_RENDERERS: dict[str, Callable[[str, dict, str], str]] = {
+    "string": lambda n, c, db: f"    {n} = Column(String{_column_options(c)})\n",
+    "text": lambda n, c, db: f"    {n} = Column(Text{_column_options(c)})\n",
+    "integer": lambda n, c, db: f"    {n} = Column(Integer{_column_options(c)})\n",
+    "boolean": lambda n, c, db: (
+        f"    {n} = Column(Boolean, default={c.get('default', False)}"
+        f"{_column_options(c, include_nullable=False)})\n"
+    ),
+    "datetime": lambda n, c, db: (
+        f"    {n} = Column(DateTime(timezone=True), server_default=func.now()"
+        f"{_column_options(c, include_nullable=False)})\n"
+    ),
+    "json": lambda n, c, db: (
+        f"    {n} = Column(JSONB, default={{}}{_column_options(c)})\n"
+        if db == "postgresql"
+        else ""
+    ),
+    "uuid": lambda n, c, db: (
+        f"    {n} = Column(UUID(as_uuid=True), default=uuid.uuid4"
+        f"{_column_options(c, include_nullable=False)})\n"
+        if db == "postgresql"
+        else ""
+    ),
+}
+
+
+def _odmantic_optional(type_name):
+    """Build a renderer for a field that is Optional unless nullable=False."""
+    return lambda n, c: (
+        f"    {n}: Optional[{type_name}] = None\n"
+        if c.get("nullable", True)
+        else f"    {n}: {type_name}\n"
+    )
 
-router = APIRouter(prefix="/{entity_name.lower()}s", tags=["{entity_name.lower()}s"])
 
+# ODMantic field renderers keyed by lower-cased field type
+ODMANTIC_RENDERERS: dict[str, Callable[[str, dict], str]] = {
+    "string": _odmantic_optional("str"),
+    "text": _odmantic_optional("str"),
+    "integer": _odmantic_optional("int"),
+    "boolean": lambda n, c: f"    {n}: bool = {c.get('default', False)}\n",
+    "datetime": lambda n, c: (
+        f"    {n}: datetime = Field(default_factory=datetime.utcnow)\n"
+    ),
+}
 
-@router.post("/", response_model={entity_name}Response)
-def create_{entity_name.lower()}({entity_name.lower()}: {entity_name}Create, db: Session = Depends(get_db)):
-    db_{entity_name.lower()} = {entity_name}(**{entity_name.lower()}.dict())
-    db.add(db_{entity_name.lower()})
-    db.commit()
-    db.refresh(db_{entity_name.lower()})
-    return db_{entity_name.lower()}
 
+def _migration_column(sa_type):
+    """Build a renderer for an op.create_table column of the given SA type."""
+    return lambda n, c, db: (
+        f"        sa.Column('{n}', {sa_type}, nullable={c.get('nullable', True)}),\n"
+    )
 
-@router.get("/", response_model=List[{entity_name}Response])
-def get_{entity_name.lower()}s(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    {entity_name.lower()}s = db.query({entity_name}).offset(skip).limit(limit).all()
-    return {entity_name.lower()}s
 
+# Alembic column renderers keyed by lower-cased field type
+MIGRATION_RENDERERS: dict[str, Callable[[str, dict, str], str]] = {
+    "string": lambda n, c, db: (
+        f"        sa.Column('{n}', sa.String({c.get('length', 255)}), "
+        f"nullable={c.get('nullable', True)}),\n"
+    ),
+    "text": _migration_column("sa.Text()"),
+    "integer": _migration_column("sa.Integer()"),
+    "boolean": lambda n, c, db: (
+        f"        sa.Column('{n}', sa.Boolean(), nullable={c.get('nullable', True)}, "
+        f"default={c.get('default', False)}),\n"
+    ),
+    "datetime": _migration_column("sa.DateTime()"),
+    "json": lambda n, c, db: (
+        _migration_column("postgresql.JSONB()")(n, c, db) if db == "postgresql" else ""
+    ),
+}
+
+
+def _map_entities(render, entities, executor=None, **kwargs):
+    """Apply a per-entity render function, in a process pool when given one."""
+    render = partial(render, **kwargs)
+    if executor is None:
+        return list(map(render, entities.keys(), entities.values()))
+    chunksize = max(1, len(entities) // ((os.cpu_count() or 1) * 4))
+    return list(
+        executor.map(render, entities.keys(), entities.values(), chunksize=chunksize)
+    )
 
-@router.get("/{{{entity_name.lower()}_id}}", response_model={entity_name}Response)
-def get_{entity_name.lower()}({entity_name.lower()}_id: int, db: Session = Depends(get_db)):
-    db_{entity_name.lower()} = db.query({entity_name}).filter({entity_name}.id == {entity_name.lower()}_id).first()
-    if db_{entity_name.lower()} is None:
-        raise HTTPException(status_code=404, detail="{entity_name} not found")
-    return db_{entity_name.lower()}
 
+def create_project_structure(base_path):
+    """Create the standard project directory structure."""
+    dirs = ("models", "schemas", "database", "migrations", "api", "core")
+    base = Path(base_path)
 
-@router.put("/{{{entity_name.lower()}_id}}", response_model={entity_name}Response)
-def update_{entity_name.lower()}({entity_name.lower()}_id: int, {entity_name.lower()}_update: {entity_name}Update, db: Session = Depends(get_db)):
-    db_{entity_name.lower()} = db.query({entity_name}).filter({entity_name}.id == {entity_name.lower()}_id).first()
-    if db_{entity_name.lower()} is None:
-        raise HTTPException(status_code=404, detail="{entity_name} not found")
+    # One directory listing up front; on re-runs most paths already exist
+    try:
+        existing = {entry.name for entry in os.scandir(base) if entry.is_dir()}
+    except FileNotFoundError:
+        existing = set()
 
-    update_data = {entity_name.lower()}_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_{entity_name.lower()}, field, value)
+    for directory in dirs:
+        path = base / directory
+        if directory in existing:
+            present = set(os.listdir(path))
+        else:
+            path.mkdir(parents=True)
+            present = set()
+        # Create __init__.py in each directory
+        if "__init__.py" not in present:
+            (path / "__init__.py").touch()
+        # Nested directory the migration script is written to
+        if directory == "migrations" and "versions" not in present:
+            (path / "versions").mkdir()
 
-    db.commit()
-    db.refresh(db_{entity_name.lower()})
-    return db_{entity_name.lower()}
+    print(f"Created project structure in {base_path}")
 
 
-@router.delete("/{{{entity_name.lower()}_id}}")
-def delete_{entity_name.lower()}({entity_name.lower()}_id: int, db: Session = Depends(get_db)):
-    db_{entity_name.lower()} = db.query({entity_name}).filter({entity_name}.id == {entity_name.lower()}_id).first()
-    if db_{entity_name.lower()} is None:
-        raise HTTPException(status_code=404, detail="{entity_name} not found")
+def generate_base_module(db_type, base_path):
+    """Write database/base.py for the chosen database type."""
+    base_content = SQLA_BASE if db_type in SQL_DB_TYPES else ODMANTIC_BASE
+    base_file = Path(base_path) / "database" / "base.py"
+    base_file.write_text(base_content, encoding="utf-8")
+
+
+def render_entity(entity_name, entity_config, db_type, models_dir, api_dir):
+    """
+    Write the model and API files for one entity in a single pass over its
+    fields and relationships.
+
+    Returns (model_file, endpoint_file, table), where table is the entity's
+    op.create_table() migration fragment, or "" for MongoDB.
+    """
+    lower_name = entity_name.lower()
+    fields = entity_config.get("fields", {})
+    sql = db_type in SQL_DB_TYPES
+
+    model_parts: list[str] = []
+    column_parts: list[str] = []
+    unique_parts: list[str] = []
+    index_parts: list[str] = []
+    display_field = None
+
+    # Add fields
+    for field_name, field_config in fields.items():
+        field_type = field_config["type"].lower()
+        if not sql:
+            render = ODMANTIC_RENDERERS.get(field_type)
+            if render:
+                model_parts.append(render(field_name, field_config))
+            continue
+
+        render = SQLA_RENDERERS.get(field_type)
+        if render:
+            model_parts.append(render(field_name, field_config, db_type))
+        render = MIGRATION_RENDERERS.get(field_type)
+        if render:
+            column_parts.append(render(field_name, field_config, db_type))
+        if field_config.get("unique", False):
+            unique_parts.append(
+                f"        # sa.UniqueConstraint('{field_name}')  # Uncomment if needed\n"
+            )
+        if field_config.get("index", False):
+            index_parts.append(
+                f"    op.create_index('ix_{lower_name}s_{field_name}', '{lower_name}s', ['{field_name}'])\n"
+            )
+        # First string field makes the repr recognisable beyond its id
+        if display_field is None and field_type == "string":
+            display_field = field_name
+
+    # Add relationships if specified
+    for rel_name, rel_config in entity_config.get("relationships", {}).items():
+        rel_type = rel_config["type"].lower()
+        target = rel_config["target"]
+
+        if not sql:
+            if rel_type == "reference":
+                model_parts.append(f"    {rel_name}_id: str = Field(reference=True)\n")
+        elif rel_type == "many-to-one":
+            foreign_key = rel_config.get("foreign_key", target.lower() + "_id")
+            # Add foreign key
+            model_parts.append(
+                f'    {foreign_key} = Column(Integer, ForeignKey("{target.lower()}s.id"))\n'
+            )
+            column_parts.append(
+                f"        sa.Column('{foreign_key}', sa.Integer(), sa.ForeignKey('{target.lower()}s.id')), \n"
+            )
+            # Add relationship
+            model_parts.append(
+                f'    {rel_name} = relationship("{target}", back_populates="{lower_name}s")\n'
+            )
+        elif rel_type == "one-to-many":
+            # Add relationship (back reference in the target entity)
+            model_parts.append(
+                f'    {rel_name} = relationship("{target}", back_populates="{rel_config.get("back_populates", lower_name)}")\n'
+            )
+
+    names = {"entity": entity_name, "entity_lower": lower_name}
+    if sql:
+        display = (
+            f", {display_field}={{self.{display_field}!r}}" if display_field else ""
+        )
+        model = [
+            SQLA_MODEL_HEADER,
+            SQLA_DIALECT_IMPORTS.get(db_type, ""),
+            f'''
 
-    db.delete(db_{entity_name.lower()})
-    db.commit()
-    return {{"message": "{entity_name} deleted successfully"}}
-'''
-        elif db_type == "mongodb":
-            endpoint_content += f'''from odmantic import AIOEngine
-from typing import List
+class {entity_name}(Base):
+    __tablename__ = "{lower_name}s"
 
-from models.{entity_name.lower()} import {entity_name}
-from schemas.{entity_name.lower()} import {entity_name}Create, {entity_name}Update, {entity_name}Response
-from database.engine import get_engine
+    id = Column(Integer, primary_key=True, index=True)
+''',
+            *model_parts,
+            f"""
 
+    def __repr__(self):
+        return f"<{entity_name}(id={{self.id}}{display})>"
+""",
+        ]
+        endpoint = SQL_ENDPOINT_TPL.substitute(names)
+        table = "".join(
+            [
+                f"""
+    # Create {entity_name} table
+    op.create_table('{lower_name}s',
+        sa.Column('id', sa.Integer(), nullable=False),
+""",
+                *column_parts,
+                "        sa.PrimaryKeyConstraint('id')\n",
+                *unique_parts,
+                "    )\n",
+                *index_parts,
+            ]
+        )
+    else:
+        model = [
+            ODMANTIC_BASE,
+            f"""
 
-router = APIRouter(prefix="/{entity_name.lower()}s", tags=["{entity_name.lower()}s"])
+class {entity_name}(Model):
+""",
+            *model_parts,
+            f'''
 
+    class Config:
+        collection = "{lower_name}s"
+''',
+        ]
+        endpoint = MONGO_ENDPOINT_TPL.substitute(names)
+        table = ""
 
-@router.post("/", response_model={entity_name}Response)
-async def create_{entity_name.lower()}({entity_name.lower()}: {entity_name}Create, engine: AIOEngine = Depends(get_engine)):
-    db_{entity_name.lower()} = {entity_name}(**{entity_name.lower()}.dict())
-    return await engine.save(db_{entity_name.lower()})
+    model_file = models_dir / f"{lower_name}.py"
+    model_file.write_bytes("".join(model).encode("utf-8"))
 
+    endpoint_file = api_dir / f"{lower_name}.py"
+    endpoint_file.write_bytes((ENDPOINT_HEADER + endpoint).encode("utf-8"))
 
-@router.get("/", response_model=List[{entity_name}Response])
-async def get_{entity_name.lower()}s(skip: int = 0, limit: int = 100, engine: AIOEngine = Depends(get_engine)):
-    return await engine.find({entity_name}, skip=skip, limit=limit)
+    return model_file, endpoint_file, table
 
 
-@router.get("/{{{entity_name.lower()}_id}}", response_model={entity_name}Response)
-async def get_{entity_name.lower()}({entity_name.lower()}_id: str, engine: AIOEngine = Depends(get_engine)):
-    db_{entity_name.lower()} = await engine.find_one({entity_name}, {entity_name}.id == {entity_name.lower()}_id)
-    if db_{entity_name.lower()} is None:
-        raise HTTPException(status_code=404, detail="{entity_name} not found")
-    return db_{entity_name.lower()}
+def generate_migration_script(entities, tables, db_type, base_path):
+    """Generate a basic migration script from per-entity table fragments."""
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    revision_id = f"{timestamp}_initial_schema"
 
+    parts: list[str] = [
+        f'''"""Initial database schema
 
-@router.put("/{{{entity_name.lower()}_id}}", response_model={entity_name}Response)
-async def update_{entity_name.lower()}({entity_name.lower()}_id: str, {entity_name.lower()}_update: {entity_name}Update, engine: AIOEngine = Depends(get_engine)):
-    db_{entity_name.lower()} = await engine.find_one({entity_name}, {entity_name}.id == {entity_name.lower()}_id)
-    if db_{entity_name.lower()} is None:
-        raise HTTPException(status_code=404, detail="{entity_name} not found")
+Revision ID: {revision_id}
+Revises:
+Create Date: {now.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]}
 
-    update_data = {entity_name.lower()}_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_{entity_name.lower()}, field, value)
+"""
+from alembic import op
+import sqlalchemy as sa
+'''
+    ]
 
-    return await engine.save(db_{entity_name.lower()})
+    parts.append(MIGRATION_DIALECT_IMPORTS.get(db_type, ""))
 
+    parts.append(f'''
 
-@router.delete("/{{{entity_name.lower()}_id}}")
-async def delete_{entity_name.lower()}({entity_name.lower()}_id: str, engine: AIOEngine = Depends(get_engine)):
-    result = await engine.delete({entity_name}, {entity_name}.id == {entity_name.lower()}_id)
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="{entity_name} not found")
-    return {{"message": "{entity_name} deleted successfully"}}
-'''
+# revision identifiers
+revision = '{revision_id}'
+down_revision = None
+branch_labels = None
+depends_on = None
 
-        endpoint_file = Path(base_path) / "api" / f"{entity_name.lower()}.py"
-        with open(endpoint_file, "w") as f:
-            f.write(endpoint_content)
+def upgrade():
+    """Create all tables for the database schema."""
+''')
 
-        print(f"Created API endpoints: {endpoint_file}")
+    # Add table creation for each entity
+    parts.extend(tables)
+
+    parts.append(f'''
+
+def downgrade():
+    """Drop all tables for rollback."""
+''')
+
+    # Reverse order for downgrade
+    for entity_name in reversed(entities):
+        parts.append(
+            f"    op.drop_index('ix_{entity_name.lower()}s_') if op.get_bind().dialect.name != 'sqlite' else None\n"
+        )
+        parts.append(f"    op.drop_table('{entity_name.lower()}s')\n")
+
+    migration_file = (
+        Path(base_path) / "migrations" / "versions" / f"{revision_id}_initial_schema.py"
+    )
+
+    migration_file.write_bytes("".join(parts).encode("utf-8"))
+
+    print(f"Created migration script: {migration_file}")
 
 
 def main():
@@ -431,11 +518,16 @@ def main():
         choices=["postgresql", "mongodb", "sqlite"],
         help="Type of database to generate schema for",
     )
-    parser.add_argument(
+    entities_source = parser.add_mutually_exclusive_group(required=True)
+    entities_source.add_argument(
         "--entities",
-        required=True,
         help='JSON string defining entities and their fields, e.g., \'{"User": {"fields": {"name": {"type": "string", "nullable": false}}}}\'',
     )
+    entities_source.add_argument(
+        "--entities-file",
+        type=Path,
+        help="Path to a JSON file defining entities (same format as --entities)",
+    )
     parser.add_argument(
         "--output", default=".", help="Output directory for generated files"
     )
@@ -444,26 +536,47 @@ def main():
 
     # Parse entities JSON
     try:
-        entities = json.loads(args.entities)
-    except json.JSONDecodeError:
+        if args.entities_file is not None:
+            entities = orjson.loads(args.entities_file.read_bytes())
+        else:
+            entities = orjson.loads(args.entities.encode())
+    except OSError as e:
+        print(f"Error: Cannot read entities file: {e}")
+        return
+    except ValueError:
         print("Error: Invalid JSON format for entities")
         return
 
     # Create project structure
     create_project_structure(args.output)
+    base = Path(args.output)
 
-    # Generate models based on database type
-    if args.db_type in ["postgresql", "sqlite"]:
-        generate_sqlalchemy_models(entities, args.db_type, args.output)
-    elif args.db_type == "mongodb":
-        generate_odmantic_models(entities, args.output)
+    # Entities are independent, so large schemas are rendered in parallel
+    executor = ProcessPoolExecutor() if len(entities) >= PARALLEL_MIN_ENTITIES else None
+    try:
+        # Models, API endpoints and migration tables in one pass per entity
+        results = _map_entities(
+            render_entity,
+            entities,
+            executor,
+            db_type=args.db_type,
+            models_dir=base / "models",
+            api_dir=base / "api",
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    generate_base_module(args.db_type, base)
+    model_kind = "SQLAlchemy" if args.db_type in SQL_DB_TYPES else "ODMantic"
+    for model_file, endpoint_file, _ in results:
+        print(f"Created {model_kind} model: {model_file}")
+        print(f"Created API endpoints: {endpoint_file}")
 
     # Generate migration script if SQL database
-    if args.db_type in ["postgresql", "sqlite"]:
-        generate_migration_script(entities, args.db_type, args.output)
-
-    # Generate FastAPI endpoints
-    generate_fastapi_endpoints(entities, args.db_type, args.output)
+    if args.db_type in SQL_DB_TYPES:
+        tables = [table for _, _, table in results]
+        generate_migration_script(entities, tables, args.db_type, base)
 
     print(f"\nDatabase schema for {args.db_type} has been generated successfully!")
     print(f"Files created in: {args.output}")
@@ -8,166 +8,219 @@ Usage:
 """
 
 import argparse
+import re
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_CAMEL1 = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL2 = re.compile(r"([a-z0-9])([A-Z])")
 
-def to_snake_case(name: str) -> str:
-    """Convert CamelCase to snake_case"""
-    result = []
-    for i, char in enumerate(name):
-        if char.isupper() and i > 0:
-            result.append("_")
-        result.append(char.lower())
-    return "".join(result)
-
-
-def generate_crud_code(model_name: str) -> str:
-    """Generate CRUD functions for a model"""
-
-    snake_name = to_snake_case(model_name)
-    plural_name = f"{snake_name}s"
 
-    return f'''"""
-CRUD operations for {model_name}
+# Code templates; $model_name, $snake_name and $plural_name are substituted
+_CRUD_TEMPLATE = string.Template('''"""
+CRUD operations for ${model_name}
 """
 
 from sqlmodel import Session, select
 from typing import Optional, List
-from app.models import {model_name}, {model_name}Create, {model_name}Update
+from app.models import ${model_name}, ${model_name}Create, ${model_name}Update
 from fastapi import HTTPException
 
 
-def create_{snake_name}(session: Session, {snake_name}: {model_name}Create) -> {model_name}:
-    """Create a new {snake_name}"""
-    db_{snake_name} = {model_name}(**{snake_name}.dict())
-    session.add(db_{snake_name})
+def create_${snake_name}(session: Session, ${snake_name}: ${model_name}Create) -> ${model_name}:
+    """Create a new ${snake_name}"""
+    db_${snake_name} = ${model_name}(**${snake_name}.dict())
+    session.add(db_${snake_name})
     session.commit()
-    session.refresh(db_{snake_name})
-    return db_{snake_name}
+    session.refresh(db_${snake_name})
+    return db_${snake_name}
 
 
-def get_{snake_name}(session: Session, {snake_name}_id: int) -> Optional[{model_name}]:
-    """Get {snake_name} by ID"""
-    return session.get({model_name}, {snake_name}_id)
+def get_${snake_name}(session: Session, ${snake_name}_id: int) -> Optional[${model_name}]:
+    """Get ${snake_name} by ID"""
+    return session.get(${model_name}, ${snake_name}_id)
 
 
-def get_{snake_name}_or_404(session: Session, {snake_name}_id: int) -> {model_name}:
-    """Get {snake_name} by ID or raise 404"""
-    {snake_name} = session.get({model_name}, {snake_name}_id)
-    if not {snake_name}:
-        raise HTTPException(status_code=404, detail="{model_name} not found")
-    return {snake_name}
+def get_${snake_name}_or_404(session: Session, ${snake_name}_id: int) -> ${model_name}:
+    """Get ${snake_name} by ID or raise 404"""
+    ${snake_name} = session.get(${model_name}, ${snake_name}_id)
+    if not ${snake_name}:
+        raise HTTPException(status_code=404, detail="${model_name} not found")
+    return ${snake_name}
 
 
-def get_{plural_name}(
+def get_${plural_name}(
     session: Session,
     skip: int = 0,
     limit: int = 100
-) -> List[{model_name}]:
-    """Get all {plural_name} with pagination"""
-    statement = select({model_name}).offset(skip).limit(limit)
+) -> List[${model_name}]:
+    """Get all ${plural_name} with pagination"""
+    statement = select(${model_name}).offset(skip).limit(limit)
     return session.exec(statement).all()
 
 
-def update_{snake_name}(
+def update_${snake_name}(
     session: Session,
-    {snake_name}_id: int,
-    {snake_name}_update: {model_name}Update
-) -> {model_name}:
-    """Update {snake_name}"""
-    db_{snake_name} = get_{snake_name}_or_404(session, {snake_name}_id)
+    ${snake_name}_id: int,
+    ${snake_name}_update: ${model_name}Update
+) -> ${model_name}:
+    """Update ${snake_name}"""
+    db_${snake_name} = get_${snake_name}_or_404(session, ${snake_name}_id)
 
     # Update only provided fields
-    update_data = {snake_name}_update.dict(exclude_unset=True)
+    update_data = ${snake_name}_update.dict(exclude_unset=True)
     for key, value in update_data.items():
-        setattr(db_{snake_name}, key, value)
+        setattr(db_${snake_name}, key, value)
 
-    session.add(db_{snake_name})
+    session.add(db_${snake_name})
     session.commit()
-    session.refresh(db_{snake_name})
-    return db_{snake_name}
+    session.refresh(db_${snake_name})
+    return db_${snake_name}
 
 
-def delete_{snake_name}(session: Session, {snake_name}_id: int) -> None:
-    """Delete {snake_name}"""
-    db_{snake_name} = get_{snake_name}_or_404(session, {snake_name}_id)
-    session.delete(db_{snake_name})
+def delete_${snake_name}(session: Session, ${snake_name}_id: int) -> None:
+    """Delete ${snake_name}"""
+    db_${snake_name} = get_${snake_name}_or_404(session, ${snake_name}_id)
+    session.delete(db_${snake_name})
     session.commit()
-'''
-
-
-def generate_router_code(model_name: str) -> str:
-    """Generate FastAPI router for a model"""
+''')
 
-    snake_name = to_snake_case(model_name)
-    plural_name = f"{snake_name}s"
-
-    return f'''"""
-API routes for {model_name}
+_ROUTER_TEMPLATE = string.Template('''"""
+API routes for ${model_name}
 """
 
 from fastapi import APIRouter, Depends, status
 from sqlmodel import Session
 from typing import List
 from app.database import get_session
-from app.models import {model_name}Create, {model_name}Update, {model_name}Read
-from app.crud import {plural_name} as crud
+from app.models import ${model_name}Create, ${model_name}Update, ${model_name}Read
+from app.crud import ${plural_name} as crud
 
 
 router = APIRouter(
-    prefix="/{plural_name}",
-    tags=["{plural_name}"]
+    prefix="/${plural_name}",
+    tags=["${plural_name}"]
 )
 
 
-@router.post("", response_model={model_name}Read, status_code=status.HTTP_201_CREATED)
-def create_{snake_name}(
-    {snake_name}: {model_name}Create,
+@router.post("", response_model=${model_name}Read, status_code=status.HTTP_201_CREATED)
+def create_${snake_name}(
+    ${snake_name}: ${model_name}Create,
     session: Session = Depends(get_session)
 ):
-    """Create a new {snake_name}"""
-    return crud.create_{snake_name}(session, {snake_name})
+    """Create a new ${snake_name}"""
+    return crud.create_${snake_name}(session, ${snake_name})
 
 
-@router.get(f"/{{{snake_name}_id}}", response_model={model_name}Read)
-def read_{snake_name}(
-    {snake_name}_id: int,
+@router.get("/{${snake_name}_id}", response_model=${model_name}Read)
+def read_${snake_name}(
+    ${snake_name}_id: int,
     session: Session = Depends(get_session)
 ):
-    """Get {snake_name} by ID"""
-    return crud.get_{snake_name}_or_404(session, {snake_name}_id)
+    """Get ${snake_name} by ID"""
+    return crud.get_${snake_name}_or_404(session, ${snake_name}_id)
 
 
-@router.get("", response_model=List[{model_name}Read])
-def read_{plural_name}(
+@router.get("", response_model=List[${model_name}Read])
+def read_${plural_name}(
     skip: int = 0,
     limit: int = 100,
     session: Session = Depends(get_session)
 ):
-    """Get all {plural_name}"""
-    return crud.get_{plural_name}(session, skip=skip, limit=limit)
+    """Get all ${plural_name}"""
+    return crud.get_${plural_name}(session, skip=skip, limit=limit)
 
 
-@router.put(f"/{{{snake_name}_id}}", response_model={model_name}Read)
-def update_{snake_name}(
-    {snake_name}_id: int,
-    {snake_name}: {model_name}Update,
+@router.put("/{${snake_name}_id}", response_model=${model_name}Read)
+def update_${snake_name}(
+    ${snake_name}_id: int,
+    ${snake_name}: ${model_name}Update,
     session: Session = Depends(get_session)
 ):
-    """Update {snake_name}"""
-    return crud.update_{snake_name}(session, {snake_name}_id, {snake_name})
+    """Update ${snake_name}"""
+    return crud.update_${snake_name}(session, ${snake_name}_id, ${snake_name})
 
 
-@router.delete(f"/{{{snake_name}_id}}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_{snake_name}(
-    {snake_name}_id: int,
+@router.delete("/{${snake_name}_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_${snake_name}(
+    ${snake_name}_id: int,
     session: Session = Depends(get_session)
 ):
-    """Delete {snake_name}"""
-    crud.delete_{snake_name}(session, {snake_name}_id)
+    """Delete ${snake_name}"""
+    crud.delete_${snake_name}(session, ${snake_name}_id)
     return None
-'''
+''')
+
+
+class _Slot:
+    """Placeholder for a template field in a pre-tokenized chunk list"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+def _tokenize(template: string.Template) -> tuple:
+    """Split a Template into literal strings and _Slot placeholders, once"""
+    text = template.template
+    chunks = []
+    pos = 0
+    for match in template.pattern.finditer(text):
+        if match["invalid"] is not None:
+            raise ValueError(f"Invalid placeholder at offset {match.start()}")
+        chunks.append(text[pos : match.start()])
+        name = match["named"] or match["braced"]
+        chunks.append(_Slot(name) if name else template.delimiter)
+        pos = match.end()
+    chunks.append(text[pos:])
+    return tuple(chunk for chunk in chunks if chunk)
+
+
+def _render(chunks: tuple, **fields: str) -> str:
+    """Join pre-tokenized chunks, filling each _Slot from fields"""
+    return "".join(
+        chunk if isinstance(chunk, str) else fields[chunk.name] for chunk in chunks
+    )
+
+
+_CRUD_CHUNKS = _tokenize(_CRUD_TEMPLATE)
+_ROUTER_CHUNKS = _tokenize(_ROUTER_TEMPLATE)
+
+
+def to_snake_case(name: str) -> str:
+    """Convert CamelCase to snake_case (acronyms kept together: HTTPServer -> http_server)"""
+    return _CAMEL2.sub(r"\1_\2", _CAMEL1.sub(r"\1_\2", name)).lower()
+
+
+def generate_crud_code(model_name: str, snake_name: str, plural_name: str) -> str:
+    """Generate CRUD functions for a model"""
+
+    return _render(
+        _CRUD_CHUNKS,
+        model_name=model_name,
+        snake_name=snake_name,
+        plural_name=plural_name,
+    )
+
+
+def generate_router_code(model_name: str, snake_name: str, plural_name: str) -> str:
+    """Generate FastAPI router for a model"""
+
+    return _render(
+        _ROUTER_CHUNKS,
+        model_name=model_name,
+        snake_name=snake_name,
+        plural_name=plural_name,
+    )
+
+
+def _write_file(path: Path, code: str) -> None:
+    """Create the parent directory if needed and write code to path"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(code, encoding="utf-8")
 
 
 def main():
@@ -191,10 +244,11 @@ def main():
 
     model_name = args.model
     snake_name = to_snake_case(model_name)
+    plural_name = f"{snake_name}s"
 
     # Generate code
-    crud_code = generate_crud_code(model_name)
-    router_code = generate_router_code(model_name)
+    crud_code = generate_crud_code(model_name, snake_name, plural_name)
+    router_code = generate_router_code(model_name, snake_name, plural_name)
 
     if args.print_only:
         print("=" * 80)
@@ -207,29 +261,27 @@ def main():
         print(router_code)
     else:
         # Determine output paths
-        crud_output = args.crud_output or f"app/crud/{snake_name}s.py"
-        router_output = args.router_output or f"app/routers/{snake_name}s.py"
+        crud_output = Path(args.crud_output or f"app/crud/{plural_name}.py")
+        router_output = Path(args.router_output or f"app/routers/{plural_name}.py")
 
-        # Create directories if needed
-        Path(crud_output).parent.mkdir(parents=True, exist_ok=True)
-        Path(router_output).parent.mkdir(parents=True, exist_ok=True)
+        # Create directories and write both files concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            crud_written = executor.submit(_write_file, crud_output, crud_code)
+            router_written = executor.submit(_write_file, router_output, router_code)
 
-        # Write files
-        with open(crud_output, "w") as f:
-            f.write(crud_code)
-        print(f"✅ Created CRUD functions: {crud_output}")
+            crud_written.result()
+            print(f"✅ Created CRUD functions: {crud_output}")
 
-        with open(router_output, "w") as f:
-            f.write(router_code)
-        print(f"✅ Created router: {router_output}")
+            router_written.result()
+            print(f"✅ Created router: {router_output}")
 
         print(f"\\nNext steps:")
         print(
             f"1. Define {model_name}Create, {model_name}Update, {model_name}Read in app/models.py"
         )
         print(f"2. Import router in app/main.py:")
-        print(f"   from app.routers import {snake_name}s")
-        print(f"   app.include_router({snake_name}s.router)")
+        print(f"   from app.routers import {plural_name}")
+        print(f"   app.include_router({plural_name}.router)")
 
 
 if __name__ == "__main__":
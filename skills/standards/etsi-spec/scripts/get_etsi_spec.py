@@ -3,6 +3,7 @@
 # dependencies = [
 #   "PyPDF2",
 #   "beautifulsoup4",
+#   "lxml",
 #   "requests",
 # ]
 # ///
@@ -28,7 +29,7 @@ Supports all ETSI document types:
 - PAS (Publicly Available Specification)
 
 Usage:
-    uv run get_etsi_spec.py <spec-number>
+    uv run get_etsi_spec.py <spec-number> [--no-cache] [--ttl SECONDS]
     uv run get_etsi_spec.py 103224
     uv run get_etsi_spec.py 103 224
     uv run get_etsi_spec.py "EG 202 396-3"
@@ -41,14 +42,121 @@ Example output:
     Download URL: https://www.etsi.org/deliver/etsi_ts/103200_103299/103224/01.07.01_60/ts_103224v010701p.pdf
 """
 
+import argparse
+import json
 import re
+import shutil
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
-from PyPDF2 import PdfReader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_DOCTYPE_RE = re.compile(r"^(?:ETSI\s+)?(EN|ES|EG|TS|TR|SR|GS|GR|PAS)\s*")
+_PART_RE = re.compile(r"-(\d+)$")
+_SPEC_THREE = re.compile(r"(\d{3})\s+(\d{3})")
+_SPEC_SIX = re.compile(r"(\d{3})(\d{3})")
+_SPEC_TWO = re.compile(r"(\d{2})\s+(\d{3})")
+_VERSION_DIR_RE = re.compile(r"(\d{2}\.\d{2}\.\d{2}(?:_\d{2})?)")
+_SYMBOLS_ONLY_RE = re.compile(r"^[^\w\s]+$")
+_PDF_DATE = re.compile(r"D:(\d{4})(\d{2})(\d{2})")
+_MONTHS = (
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+)
+
+# Lookup results are cached as JSON, one file per spec
+_CACHE_DIR = Path("~/.cache/etsi-spec").expanduser()
+DEFAULT_CACHE_TTL = 86400  # seconds
+
+# One keep-alive session: every lookup makes several requests to www.etsi.org
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "etsi-spec-lookup/1.0"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+
+class _UncachedResponse(Exception):
+    """Carries a non-200 listing response past the cache without storing it."""
+
+    def __init__(self, response):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+@lru_cache(maxsize=None)  # noqa: UP033 - functools.cache needs Python 3.9+
+def _cached_listing(url):
+    """GET a directory listing; raising keeps non-200 responses out of the cache."""
+    response = _SESSION.get(url, timeout=30)
+    if response.status_code != 200:
+        raise _UncachedResponse(response)
+    return response
+
+
+def _get_listing(url):
+    """GET an ETSI directory listing, reusing this run's earlier 200 response."""
+    try:
+        return _cached_listing(url)
+    except _UncachedResponse as uncached:
+        return uncached.response
+
+
+def _cache_key(spec_info):
+    """Build the cache file stem from doc type, prefix, number and part."""
+    key = f"{spec_info['doc_type']}_{spec_info['prefix']}_{spec_info['number']}"
+    if spec_info["part"]:
+        key = f"{key}-{spec_info['part']}"
+    return key.lower()
+
+
+def _load_cache(key, ttl):
+    """Return the cached lookup result for key, or None if missing or stale."""
+    cache_file = _CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime >= ttl:
+            return None
+        text = cache_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:  # truncated or corrupt cache file
+        return None
+
+
+def _store_cache(key, result):
+    """Write a lookup result to the cache; failures only cost a future refetch."""
+    # default=str keeps any non-JSON value (e.g. a PDF object) from failing the run
+    payload = json.dumps(result, default=str)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_CACHE_DIR / f"{key}.json").write_text(payload, encoding="utf-8")
+    except OSError:
+        pass
 
 
 def parse_spec_number(spec_input):
@@ -69,28 +177,21 @@ def parse_spec_number(spec_input):
     spec_input = spec_input.strip().upper()
 
     # Extract document type (EN, ES, EG, TS, TR, SR, GS, GR, PAS)
-    doc_types = ["EN", "ES", "EG", "TS", "TR", "SR", "GS", "GR", "PAS"]
     doc_type = "TS"  # Default
-
-    for dt in doc_types:
-        if spec_input.startswith(f"ETSI {dt}"):
-            doc_type = dt
-            spec_input = spec_input.replace(f"ETSI {dt}", "").strip()
-            break
-        elif spec_input.startswith(dt):
-            doc_type = dt
-            spec_input = spec_input[len(dt) :].strip()
-            break
+    match = _DOCTYPE_RE.match(spec_input)
+    if match:
+        doc_type = match.group(1)
+        spec_input = spec_input[match.end() :]
 
     # Extract part number if present (e.g., "-3", "-1", "-2")
     part = None
-    part_match = re.search(r"-(\d+)$", spec_input)
+    part_match = _PART_RE.search(spec_input)
     if part_match:
         part = part_match.group(1)
         spec_input = spec_input[: -len(part_match.group(0))].strip()
 
     # Match pattern: three digits, space, three digits (e.g., "103 224")
-    match = re.match(r"(\d{3})\s+(\d{3})", spec_input)
+    match = _SPEC_THREE.match(spec_input)
     if match:
         return {
             "doc_type": doc_type,
@@ -100,7 +201,7 @@ def parse_spec_number(spec_input):
         }
 
     # Match pattern: six digits (e.g., "103224")
-    match = re.match(r"(\d{3})(\d{3})", spec_input)
+    match = _SPEC_SIX.match(spec_input)
     if match:
         return {
             "doc_type": doc_type,
@@ -110,7 +211,7 @@ def parse_spec_number(spec_input):
         }
 
     # Match pattern: two digits, space, three digits (e.g., "01 001")
-    match = re.match(r"(\d{2})\s+(\d{3})", spec_input)
+    match = _SPEC_TWO.match(spec_input)
     if match:
         return {
             "doc_type": doc_type,
@@ -126,8 +227,8 @@ def get_spec_directory_url(spec_info):
     """
     Construct ETSI delivery directory URL for specification.
 
-    For multi-part specs (e.g., EG 202 396-3), searches all range directories
-    to find the one containing the spec.
+    The URL is computed from the spec number and confirmed with a single HEAD
+    request; the document type listing is only searched when that URL 404s.
 
     Args:
         spec_info: dict with 'doc_type', 'prefix', 'number', 'part'
@@ -135,72 +236,58 @@ def get_spec_directory_url(spec_info):
     Returns:
         str: Directory URL
     """
-    doc_type = spec_info["doc_type"].lower()
-    prefix = spec_info["prefix"]
-    number = spec_info["number"]
+    return _spec_directory_url(
+        spec_info["doc_type"],
+        spec_info["prefix"],
+        spec_info["number"],
+        spec_info["part"],
+    )
+
+
+@lru_cache(maxsize=128)
+def _spec_directory_url(doc_type, prefix, number, part):
+    """Resolve the directory URL; memoised per (doc_type, prefix, number, part)."""
+    doc_type = doc_type.lower()
+
+    # Directory name is the spec number plus a two-digit part, if present
+    # For EG 202 396-3, the directory is named "20239603"
+    dir_name = f"{prefix}{number}"
+    if part:
+        dir_name = f"{dir_name}{int(part):02d}"
+
+    # Derive the 100-number range directory from the spec number
+    # (without part), e.g. 103224 -> 103200_103299
+    base_url = f"https://www.etsi.org/deliver/etsi_{doc_type}/"
+    range_start = int(f"{prefix}{number}") // 100 * 100
+    range_dir = f"{range_start:03d}_{range_start + 99:03d}"
+    url = f"{base_url}{range_dir}/{dir_name}/"
 
-    # Format spec number with part if present
-    if spec_info["part"]:
-        full_spec = f"{prefix}{number}-{spec_info['part']}"
-    else:
-        full_spec = f"{prefix}{number}"
+    try:
+        response = _SESSION.head(url, allow_redirects=True, timeout=10)
+        if response.status_code != 404:
+            return url
+    except requests.RequestException:
+        return url
 
-    # For multi-part specs, we need to search for the directory that contains the spec
-    # First, construct the base URL for the document type
-    base_url = f"https://www.etsi.org/deliver/etsi_{doc_type}/"
+    from bs4 import BeautifulSoup
 
     try:
         # Get the directory listing to find the correct range
-        response = requests.get(base_url, timeout=30)
+        response = _get_listing(base_url)
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
 
-            # Look for the directory containing our full spec number
-            # For EG 202 396-3, we look for a directory named "20239603"
-            for link in soup.find_all("a"):
-                href = link.get("href", "")
-
-                # Check if this is a directory link and contains our spec
-                if full_spec in href and "dir" in href:
-                    # Extract the directory path (without trailing slash)
-                    dir_path = href.rstrip("/")
-                    url = f"{base_url}{dir_path}"
-                    return url
+            # Look for the first directory link containing our spec directory
+            link = soup.find(
+                "a", href=lambda href: href and dir_name in href and "dir" in href
+            )
+            if link:
+                # Extract the directory path (without trailing slash)
+                return f"{base_url}{link['href'].rstrip('/')}"
 
     except Exception:
         pass
 
-    # Fallback: try to determine the range based on spec number (without part)
-    # This is for single-part specs
-    if spec_info["part"]:
-        # For multi-part, use spec without part for range calculation
-        dir_spec_num = int(f"{prefix}{number}")
-    else:
-        dir_spec_num = int(f"{prefix}{number}")
-
-    # Determine the appropriate 100-number range
-    if dir_spec_num < 100:
-        range_suffix = "00_099"
-    elif dir_spec_num < 200:
-        range_suffix = "100_199"
-    elif dir_spec_num < 300:
-        range_suffix = "200_299"
-    elif dir_spec_num < 400:
-        range_suffix = "300_399"
-    elif dir_spec_num < 500:
-        range_suffix = "400_499"
-    elif dir_spec_num < 600:
-        range_suffix = "500_599"
-    elif dir_spec_num < 700:
-        range_suffix = "600_699"
-    elif dir_spec_num < 800:
-        range_suffix = "700_799"
-    elif dir_spec_num < 900:
-        range_suffix = "800_899"
-    else:
-        range_suffix = "900_999"
-
-    url = f"https://www.etsi.org/deliver/etsi_{doc_type}/{prefix}{range_suffix}/{full_spec}/"
     return url
 
 
@@ -216,15 +303,23 @@ def get_version_directories(directory_url, spec_info):
         list of tuples: [(version_name, version_number, release_date), ...]
         sorted by version number (descending)
     """
-    response = requests.get(directory_url, timeout=30)
+    return list(_version_directories(directory_url))
+
+
+@lru_cache(maxsize=128)
+def _version_directories(directory_url):
+    """Scrape version directories; memoised per URL, returned as a tuple."""
+    from bs4 import BeautifulSoup
+
+    response = _get_listing(directory_url)
 
     # 404 means spec doesn't exist or different URL structure
     if response.status_code == 404:
-        return []
+        return ()
 
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.content, "lxml")
 
     version_dirs = []
 
@@ -234,7 +329,7 @@ def get_version_directories(directory_url, spec_info):
         href = link.get("href", "")
 
         # Match version directory pattern: XX.YY.ZZ_AA or XX.YY.ZZ
-        match = re.search(r"(\d{2}\.\d{2}\.\d{2}(?:_\d{2})?", href)
+        match = _VERSION_DIR_RE.search(href)
         if match:
             version_dir = match.group(1)
 
@@ -248,12 +343,20 @@ def get_version_directories(directory_url, spec_info):
     # Sort by version number (descending)
     version_dirs.sort(key=lambda x: x[1], reverse=True)
 
-    return version_dirs
+    return tuple(version_dirs)
+
+
+def _pdf_exists(pdf_url):
+    """Check with a HEAD request whether a PDF exists at pdf_url."""
+    return _SESSION.head(pdf_url, timeout=10).status_code == 200
 
 
 def get_pdf_url(directory_url, version_dir, spec_info):
     """
-    Construct PDF download URL for specific version.
+    Find PDF download URL for specific version.
+
+    Reads the version directory listing once; falls back to probing common
+    filename patterns when the listing is unavailable.
 
     Args:
         directory_url: Base directory URL
@@ -263,6 +366,8 @@ def get_pdf_url(directory_url, version_dir, spec_info):
     Returns:
         str: PDF URL
     """
+    from bs4 import BeautifulSoup
+
     doc_type = spec_info["doc_type"].lower()
 
     # Format spec number with part if present
@@ -274,6 +379,17 @@ def get_pdf_url(directory_url, version_dir, spec_info):
     # Construct version directory URL
     version_url = f"{directory_url.rstrip('/')}/{version_dir}/"
 
+    # A single listing request names the actual PDF file
+    try:
+        response = _get_listing(version_url)
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.content, "lxml")
+            for link in soup.find_all("a", href=True):
+                if link["href"].lower().endswith(".pdf"):
+                    return urljoin(version_url, link["href"])
+    except requests.RequestException:
+        pass
+
     # PDF filename pattern varies by document type
     # TS/EN/ES/TR: ts_<spec_number>v<version_no_dots>p.pdf or en_<spec>v<version_no_dots>.pdf
     # EG/SR/GS/GR: often just a spec name with version
@@ -281,7 +397,7 @@ def get_pdf_url(directory_url, version_dir, spec_info):
     version_num = version_dir.split("_")[0]
     version_no_dots = version_num.replace(".", "")
 
-    # Try common filename patterns
+    # Listing unavailable (e.g. 403): try common filename patterns
     possible_filenames = [
         f"{doc_type}_{full_spec}v{version_no_dots}p.pdf",
         f"{doc_type}_{full_spec}v{version_no_dots}.pdf",
@@ -289,61 +405,93 @@ def get_pdf_url(directory_url, version_dir, spec_info):
         f"{full_spec}v{version_no_dots}p.pdf",
     ]
 
-    for filename in possible_filenames:
-        pdf_url = f"{version_url}{filename}"
-        # Check if PDF exists
-        test_response = requests.head(pdf_url, timeout=10)
-        if test_response.status_code == 200:
-            return pdf_url
+    pdf_urls = [f"{version_url}{filename}" for filename in possible_filenames]
+
+    # Probe all candidates concurrently; first match in pattern order wins
+    with ThreadPoolExecutor(max_workers=len(pdf_urls)) as executor:
+        found = executor.map(_pdf_exists, pdf_urls)
+        for pdf_url, exists in zip(pdf_urls, found):
+            if exists:
+                return pdf_url
 
     raise ValueError(f"Could not find PDF file in {version_url}")
 
 
+def read_pdf_fields(pdf_file):
+    """
+    Read title and creation date from an open, seekable PDF file.
+
+    Args:
+        pdf_file: Binary file object positioned anywhere
+
+    Returns:
+        dict: 'title' and 'creation_date' where available
+    """
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(pdf_file, strict=False)
+
+    metadata = {}
+
+    # Get PDF metadata; values may be indirect references, resolve to plain str
+    if reader.metadata:
+        for field, key in (("title", "/Title"), ("creation_date", "/CreationDate")):
+            value = reader.metadata.get(key, "")
+            if hasattr(value, "get_object"):
+                value = value.get_object()
+            metadata[field] = str(value)
+
+    # A /Title in the metadata is enough; page 0 is only decoded without one
+    if metadata.get("title"):
+        return metadata
+
+    # Title not in metadata, try to extract from first page
+    text = reader.pages[0].extract_text()
+
+    # ETSI specs typically have title on first page
+    # Look for pattern: "ETSI XXX YYY" or similar
+    lines = text.split("\n", 20)[:20]  # Only split off the first 20 lines
+    for line in lines:
+        line = line.strip()
+        if line and len(line) > 20:  # Reasonable title length
+            # Skip lines with only special characters
+            if not _SYMBOLS_ONLY_RE.match(line):
+                metadata["title"] = line
+                break
+
+    return metadata
+
+
 def extract_pdf_metadata(pdf_url):
     """
     Extract metadata from PDF document.
 
+    The download is streamed into a spooled temporary file, so only small
+    PDFs are held in memory; larger ones spill to disk.
+
     Args:
         pdf_url: URL of PDF document
 
     Returns:
         dict: Metadata including title, publication date
     """
-    response = requests.get(pdf_url, timeout=30)
-    response.raise_for_status()
-
-    import io
-
-    pdf_file = io.BytesIO(response.content)
-    reader = PdfReader(pdf_file)
+    return dict(_pdf_metadata(pdf_url))
 
-    metadata = {}
 
-    # Get PDF metadata
-    if reader.metadata:
-        metadata["title"] = reader.metadata.get("/Title", "")
-        metadata["creation_date"] = reader.metadata.get("/CreationDate", "")
-
-    # If title not in metadata, try to extract from first page
-    if not metadata.get("title"):
-        first_page = reader.pages[0]
-        text = first_page.extract_text()
-
-        # ETSI specs typically have title on first page
-        # Look for pattern: "ETSI XXX YYY" or similar
-        lines = text.split("\n")
-        for line in lines[:20]:  # Check first 20 lines
-            line = line.strip()
-            if line and len(line) > 20:  # Reasonable title length
-                # Skip lines with only special characters
-                if not re.match(r"^[^\w\s]+$", line):
-                    metadata["title"] = line
-                    break
+@lru_cache(maxsize=128)
+def _pdf_metadata(pdf_url):
+    """Download and parse a PDF once per URL; callers get a copy."""
+    with _SESSION.get(pdf_url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with SpooledTemporaryFile(max_size=256 * 1024) as pdf_file:
+            shutil.copyfileobj(response.raw, pdf_file)
+            metadata = read_pdf_fields(pdf_file)
 
     # Parse publication date from metadata
     if metadata.get("creation_date"):
         # ETSI date format: D:YYYYMMDDHHmmSS+HH'mm'
-        match = re.search(r"D:(\d{4})(\d{2})(\d{2})", metadata["creation_date"])
+        match = _PDF_DATE.search(metadata["creation_date"])
         if match:
             year = match.group(1)
             month = match.group(2)
@@ -372,21 +520,73 @@ def format_version(version_num):
     return version_num
 
 
+def lookup_spec(spec_info):
+    """
+    Run the network lookup for a parsed specification.
+
+    Args:
+        spec_info: dict with 'doc_type', 'prefix', 'number', 'part'
+
+    Returns:
+        dict: 'directory_url', 'version_dirs' and, when versions were found,
+        'pdf_url' and 'metadata'
+    """
+    # Get directory URL
+    directory_url = get_spec_directory_url(spec_info)
+    print(f"Directory: {directory_url}")
+
+    # Get version directories
+    version_dirs = get_version_directories(directory_url, spec_info)
+    result = {"directory_url": directory_url, "version_dirs": version_dirs}
+    if not version_dirs:
+        return result
+
+    # Get latest version
+    latest_dir, latest_num, release_code = version_dirs[0]
+    print(f"Latest version: {format_version(latest_num)} (release {release_code})")
+    print()
+
+    # Get PDF URL
+    result["pdf_url"] = get_pdf_url(directory_url, latest_dir, spec_info)
+
+    # Extract metadata from PDF
+    print("Extracting metadata from PDF...")
+    result["metadata"] = extract_pdf_metadata(result["pdf_url"])
+
+    return result
+
+
 def main():
     """Main function to retrieve and display ETSI spec metadata."""
-    if len(sys.argv) < 2:
-        print("Usage: uv run get_etsi_spec.py <spec-number>")
-        print()
-        print("Examples:")
-        print("  uv run get_etsi_spec.py 103224")
-        print("  uv run get_etsi_spec.py 103 224")
-        print("  uv run get_etsi_spec.py ETSI TS 103 224")
-        print("  uv run get_etsi_spec.py EG 202 396-3")
-        print("  uv run get_etsi_spec.py TR 103 907")
-        print("  uv run get_etsi_spec.py ES 200 381-1")
-        sys.exit(1)
-
-    spec_input = sys.argv[1]
+    parser = argparse.ArgumentParser(
+        description="Retrieve metadata for an ETSI specification",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Examples:
+  uv run get_etsi_spec.py 103224
+  uv run get_etsi_spec.py 103 224
+  uv run get_etsi_spec.py ETSI TS 103 224
+  uv run get_etsi_spec.py EG 202 396-3
+  uv run get_etsi_spec.py TR 103 907
+  uv run get_etsi_spec.py ES 200 381-1""",
+    )
+    parser.add_argument(
+        "spec", nargs="+", help="Specification number, e.g. 'TS 103 224'"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore and refresh the cached result in {_CACHE_DIR}",
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        metavar="SECONDS",
+        help=f"Maximum age of a cached result (default: {DEFAULT_CACHE_TTL})",
+    )
+    args = parser.parse_args()
+
+    spec_input = " ".join(args.spec)
 
     try:
         # Parse specification number
@@ -403,12 +603,17 @@ def main():
         print(f"Searching for ETSI {spec_info['doc_type']} {full_spec}...")
         print()
 
-        # Get directory URL
-        directory_url = get_spec_directory_url(spec_info)
-        print(f"Directory: {directory_url}")
+        cache_key = _cache_key(spec_info)
+        result = None if args.no_cache else _load_cache(cache_key, args.ttl)
+        if result is None:
+            result = lookup_spec(spec_info)
+            if result["version_dirs"]:
+                _store_cache(cache_key, result)
+        else:
+            print(f"Using cached result ({_CACHE_DIR / cache_key}.json)")
+            print()
 
-        # Get version directories
-        version_dirs = get_version_directories(directory_url, spec_info)
+        version_dirs = result["version_dirs"]
 
         if not version_dirs:
             print(
@@ -421,50 +626,48 @@ def main():
             print("  - Try checking: https://www.etsi.org/deliver/etsi_<type>/")
             sys.exit(1)
 
-        # Get latest version
         latest_dir, latest_num, release_code = version_dirs[0]
-        print(f"Latest version: {format_version(latest_num)} (release {release_code})")
-        print()
-
-        # Get PDF URL
-        pdf_url = get_pdf_url(directory_url, latest_dir, spec_info)
-
-        # Extract metadata from PDF
-        print("Extracting metadata from PDF...")
-        metadata = extract_pdf_metadata(pdf_url)
-
-        # Display results
-        print("=" * 70)
-        print(f"SPECIFICATION: ETSI {spec_info['doc_type']} {full_spec}")
-        print("=" * 70)
-        print(f"Latest Version:  {format_version(latest_num)}")
-        print(f"Release Code:    {release_code}")
-        print(f"Directory:       {latest_dir}")
+        pdf_url = result["pdf_url"]
+        metadata = result["metadata"]
+
+        # Display results, written to stdout in one go
+        report = [
+            "=" * 70,
+            f"SPECIFICATION: ETSI {spec_info['doc_type']} {full_spec}",
+            "=" * 70,
+            f"Latest Version:  {format_version(latest_num)}",
+            f"Release Code:    {release_code}",
+            f"Directory:       {latest_dir}",
+        ]
 
         if metadata.get("title"):
-            print(f"Title:           {metadata['title']}")
+            report.append(f"Title:           {metadata['title']}")
 
         if metadata.get("publication_date"):
             pub_date = metadata["publication_date"]
-            # Format as month name
-            try:
-                dt = datetime.strptime(pub_date, "%Y-%m-%d")
-                pub_date_formatted = dt.strftime("%b %Y").lower()
-            except:
-                pub_date_formatted = pub_date
-            print(f"Publication Date: {pub_date_formatted}")
-
-        print(f"Download URL:    {pdf_url}")
-        print("=" * 70)
-        print()
-        print(f"Full versions available: {len(version_dirs)}")
+            # Format as month name (publication_date is always YYYY-MM-DD)
+            pub_date_formatted = pub_date
+            year, month, _ = pub_date.split("-")
+            month_num = int(month)
+            if 1 <= month_num <= 12:
+                pub_date_formatted = f"{_MONTHS[month_num - 1]} {year}"
+            report.append(f"Publication Date: {pub_date_formatted}")
+
+        report += [
+            f"Download URL:    {pdf_url}",
+            "=" * 70,
+            "",
+            f"Full versions available: {len(version_dirs)}",
+        ]
         if len(version_dirs) > 1:
-            print("Version history:")
-            for version_dir, version_num, release_code in version_dirs:
-                pub_year = version_num.split(".")[0][:2]
-                print(
-                    f"  - {format_version(version_num)} (release {release_code}) ~ 20{pub_year}"
-                )
+            report.append("Version history:")
+            report += [
+                f"  - {format_version(version_num)} (release {release_code})"
+                f" ~ 20{version_num.split('.')[0][:2]}"
+                for _, version_num, release_code in version_dirs
+            ]
+
+        sys.stdout.write("\n".join(report) + "\n")
 
     except ValueError as e:
         print(f"Error: {e}")